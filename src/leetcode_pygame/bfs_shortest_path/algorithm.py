@@ -1,71 +1,111 @@
-from collections import deque
-import random
-from typing import Callable, List, Optional
-from functools import partial
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # no cov
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba's `njit` when numba is not installed (e.g. on PyPy).
+        Supports both `@njit` and `@njit(...)` and returns the function untouched,
+        so the decorated code simply runs as plain Python.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
 
 WALL = 1
 NON_WALL = 0
 
-DIRECTIONS = [
-    (1, 0),  # Right
-    (1, 1),  # Bottom-Right
-    (0, 1),  # Bottom
-    (-1, 1),  # Bottom-Left
-    (-1, 0),  # Left
-    (-1, -1),  # Top-Left
-    (0, -1),  # Top
-    (1, -1),  # Top-Right
-]
-
-
-def is_valid(
-    x: int,
-    y: int,
-    grid: List[List[int]],
-    size: int,
-    visited: List[List[bool]],
-) -> bool:
-    """
-    Given a position (x, y), verifies if it is within the grid's boundaries,
-    if it is not a wall (grid[x][y] == 1), if it is not visited before.
-    Use this function to test if a candidate neighbor can be queued for a visit.
-    """
-    if not (x >= 0 and x < size and y >= 0 and y < size):
-        return False
-    if grid[x][y] == WALL:
-        return False
-    if visited[x][y]:
-        return False
-    return True
-
-
-def visit_neighbors(
-    x: int,
-    y: int,
-    grid: List[List[int]],
+# The 8 directions as parallel tuples of x and y offsets, read by index. Tuples are
+# compile-time constants for numba, which lets it unroll the loops over directions.
+#    Right, Bottom-Right, Bottom, Bottom-Left, Left, Top-Left, Top, Top-Right
+DX = (1, 1, 0, -1, -1, -1, 0, 1)
+DY = (0, 1, 1, 1, 0, -1, -1, -1)
+
+# Reinterprets a coordinate as uint32 for the bounds check of the compiled BFS
+_UINT32_MASK = 0xFFFFFFFF
+
+# The compiled BFS expands a level bottom-up once the frontier holds more than
+# 1 / _BOTTOM_UP_ALPHA of the cells left to visit (14 is the value of Beamer et al.)
+_BOTTOM_UP_ALPHA = 14
+
+# A grid is a square uint8 matrix of WALL and NON_WALL cells. Lists of lists are accepted
+# wherever a grid is read, and converted once with `_grid_view`.
+Grid = Union[np.ndarray, List[List[int]]]
+
+
+def _grid_view(grid: Grid) -> np.ndarray:
+    """
+    Returns the grid as a contiguous uint8 numpy array. Arrays that already have the
+    right layout are returned as they are, lists of lists are copied once.
+    """
+    return np.ascontiguousarray(grid, dtype=np.uint8)
+
+
+# The explicit signature makes numba compile this entry point, or load it from its
+# on-disk cache, when the module is imported rather than on the first call. Its
+# arguments must have exactly these types: contiguous uint8 grid and visited cells,
+# contiguous int32 queue and parents.
+@njit(
+    "Tuple((boolean, int64))"
+    "(uint8[::1], int64, uint8[::1], int32[::1], int64, int64, int32[::1], int64)",
+    cache=True,
+)
+def visit_level(
+    grid: np.ndarray,
     size: int,
-    visited: List[List[bool]],
-    queue: deque,
-) -> None:
+    visited: np.ndarray,
+    queue: np.ndarray,
+    head: int,
+    tail: int,
+    parents: np.ndarray,
+    end: int,
+) -> tuple[bool, int]:
     """
-    Given a position (x, y), visit its neighbors and queue them for a visit.
-    Returns the list of neighbors for further processing in the simulation.
+    Visits one BFS level for the simulation: the cells queue[head:tail], in order.
+    Every valid neighbor is marked as visited, gets the current cell as its parent and
+    is appended to the queue. Cells are encoded as `x * size + y`, and grid, visited and
+    parents are flat arrays indexed by them. Each cell is queued at most once, so a
+    queue of size * size cells never overflows.
+
+    Returns whether the end was reached, and the new tail of the queue: the cells
+    discovered by this call are queue[tail:new_tail].
     """
-    is_valid_partial = partial(is_valid, grid=grid, size=size, visited=visited)
-    neighbors = []
-
-    for dx, dy in DIRECTIONS:
-        new_x, new_y = x + dx, y + dy
-        if is_valid_partial(new_x, new_y):
-            visited[new_x][new_y] = True
-            neighbors.append((new_x, new_y))
-
-    queue.extend(neighbors)
-    return neighbors
+    new_tail = tail
+
+    for i in range(head, tail):
+        cell = int(queue[i])
+        # Stop at the end; the cells discovered before it are still returned
+        if cell == end:
+            return True, new_tail
+
+        x = cell // size
+        y = cell - x * size
+        for k in range(8):
+            new_x, new_y = x + DX[k], y + DY[k]
+            # Unsigned bounds check, see _expand_top_down
+            in_bounds = ((new_x & _UINT32_MASK) < size) & (
+                (new_y & _UINT32_MASK) < size
+            )
+            if not in_bounds:
+                continue
+            neighbor = new_x * size + new_y
+            if grid[neighbor] == WALL or visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            parents[neighbor] = cell
+            queue[new_tail] = neighbor
+            new_tail += 1
+
+    return False, new_tail
 
 
 def shortest_path(
-    grid: List[List[int]],
+    grid: Grid,
     start: tuple[int, int] = (0, 0),
     end: tuple[int, int] = None,
 ) -> int:
@@ -73,48 +113,274 @@ def shortest_path(
     Given a square grid, find the shortest path from the start to the end.
     Returns the number of steps required to reach the end from the start.
     If no path is found, returns -1.
+    Raises IndexError if the start or the end is outside the grid, and ValueError if
+    the grid is not square.
     """
-
-    # Size of the grid; assuming it is a square grid
     size = len(grid)
 
-    # Initialize the level of the BFS traversal
-    level = 0
-
     # If end is not provided, set it to the bottom-right corner of the grid
     if end is None:
         end = (size - 1, size - 1)
 
-    # If start or end is a wall, return -1
     start_x, start_y = start
     end_x, end_y = end
-    if grid[start_x][start_y] == WALL or grid[end_x][end_y] == WALL:
+
+    # The compiled search does not check its indices, so reject cells outside the grid
+    for x, y in (start, end):
+        if not (0 <= x < size and 0 <= y < size):
+            raise IndexError(f"Cell {(x, y)} is outside of the {size}x{size} grid")
+
+    # A path from a cell to itself needs neither the conversion nor the search below
+    if start_x == end_x and start_y == end_y:
+        return -1 if grid[start_x][start_y] == WALL else 1
+
+    # Work on a uint8 array regardless of what the caller passed in
+    grid = _grid_view(grid)
+    # The compiled search indexes cells as x * size + y, which only holds for a square grid
+    if grid.shape != (size, size):
+        raise ValueError(f"Grid must be square, got shape {grid.shape}")
+    return _shortest_path(grid.ravel(), size, start_x, start_y, end_x, end_y)
+
+
+@njit(cache=True, inline="always")
+def _is_marked(bitset: np.ndarray, cell: int) -> bool:
+    """
+    Tests the bit of the cell in a bitset of uint64 words, 64 cells per word.
+    """
+    return (bitset[cell >> 6] >> np.uint64(cell & 63)) & np.uint64(1) != 0
+
+
+@njit(cache=True, inline="always")
+def _mark(bitset: np.ndarray, cell: int) -> None:
+    """
+    Sets the bit of the cell in a bitset of uint64 words, 64 cells per word.
+    """
+    bitset[cell >> 6] |= np.uint64(1) << np.uint64(cell & 63)
+
+
+@njit(cache=True)
+def _expand_top_down(
+    cells: np.ndarray,
+    size: int,
+    frontier: np.ndarray,
+    frontier_size: int,
+    next_frontier: np.ndarray,
+    visited: np.ndarray,
+    other_visited: np.ndarray,
+) -> int:
+    """
+    Expands one BFS level by visiting the neighbors of every frontier cell: every valid
+    neighbor is marked as visited and appended to the next frontier.
+    Returns the size of the next frontier, or -1 as soon as a neighbor turns out to be
+    visited from the other side already, which means the two searches have met.
+    """
+    next_frontier_size = 0
+
+    for i in range(frontier_size):
+        cell = int(frontier[i])
+        x = cell // size
+        y = cell - x * size
+        for k in range(8):
+            new_x, new_y = x + DX[k], y + DY[k]
+            # Unsigned bounds check: masking to 32 bits turns negative coordinates into
+            # huge ones, so one comparison per axis covers both ends of the range
+            in_bounds = ((new_x & _UINT32_MASK) < size) & (
+                (new_y & _UINT32_MASK) < size
+            )
+            if not in_bounds:
+                continue
+            neighbor = new_x * size + new_y
+            if cells[neighbor] == WALL or _is_marked(visited, neighbor):
+                continue
+            # The searches meet as soon as a discovered cell belongs to the other side
+            if _is_marked(other_visited, neighbor):
+                return -1
+            _mark(visited, neighbor)
+            next_frontier[next_frontier_size] = neighbor
+            next_frontier_size += 1
+
+    return next_frontier_size
+
+
+@njit(cache=True)
+def _expand_bottom_up(
+    cells: np.ndarray,
+    size: int,
+    frontier: np.ndarray,
+    frontier_size: int,
+    frontier_bits: np.ndarray,
+    next_frontier: np.ndarray,
+    visited: np.ndarray,
+    other_visited: np.ndarray,
+) -> int:
+    """
+    Expands one BFS level the other way around: every cell that is not visited yet looks
+    for a neighbor in the frontier, and stops at the first one it finds.
+    Discovers exactly the same cells as `_expand_top_down` and returns the same values.
+    """
+    # Mark the frontier in a bitset so that membership is a single bit test
+    frontier_bits[:] = 0
+    for i in range(frontier_size):
+        _mark(frontier_bits, int(frontier[i]))
+
+    next_frontier_size = 0
+
+    for cell in range(size * size):
+        if cells[cell] == WALL or _is_marked(visited, cell):
+            continue
+        x = cell // size
+        y = cell - x * size
+        for k in range(8):
+            new_x, new_y = x + DX[k], y + DY[k]
+            in_bounds = ((new_x & _UINT32_MASK) < size) & (
+                (new_y & _UINT32_MASK) < size
+            )
+            if not in_bounds or not _is_marked(frontier_bits, new_x * size + new_y):
+                continue
+            if _is_marked(other_visited, cell):
+                return -1
+            _mark(visited, cell)
+            next_frontier[next_frontier_size] = cell
+            next_frontier_size += 1
+            break
+
+    return next_frontier_size
+
+
+@njit(cache=True)
+def _expand_level(
+    cells: np.ndarray,
+    size: int,
+    frontier: np.ndarray,
+    frontier_size: int,
+    frontier_bits: np.ndarray,
+    next_frontier: np.ndarray,
+    visited: np.ndarray,
+    other_visited: np.ndarray,
+    unvisited: int,
+) -> int:
+    """
+    Expands one BFS level of one side of the bidirectional search, either top-down or
+    bottom-up. Top-down work grows with the frontier and bottom-up work with the cells
+    left to visit, so bottom-up is used while the frontier is the larger of the two
+    (direction-optimizing BFS, Beamer et al.).
+    Returns the size of the next frontier, or -1 if the two searches have met.
+    """
+    if frontier_size * _BOTTOM_UP_ALPHA > unvisited:
+        return _expand_bottom_up(
+            cells,
+            size,
+            frontier,
+            frontier_size,
+            frontier_bits,
+            next_frontier,
+            visited,
+            other_visited,
+        )
+    return _expand_top_down(
+        cells, size, frontier, frontier_size, next_frontier, visited, other_visited
+    )
+
+
+# Compiled at import like `visit_level`; `shortest_path` passes a contiguous uint8 grid.
+@njit("int64(uint8[::1], int64, int64, int64, int64, int64)", cache=True)
+def _shortest_path(
+    cells: np.ndarray,
+    size: int,
+    start_x: int,
+    start_y: int,
+    end_x: int,
+    end_y: int,
+) -> int:
+    """
+    Compiled body of `shortest_path`: a bidirectional, level-by-level BFS.
+    One search starts from the start and another one from the end; at each step the
+    side with the smaller frontier expands one full level, until a cell discovered by
+    one side was already visited by the other. Each level is expanded top-down or
+    bottom-up, see `_expand_level`. Cells are encoded as `x * size + y`, every frontier
+    is a preallocated array and visited cells are kept in bitsets.
+
+    The grid is passed as a flat row-major buffer of size * size cells along with plain
+    integer coordinates, the same interface a C implementation would export.
+    """
+
+    # Address the grid and the visited bitsets with the same flat index
+    start = start_x * size + start_y
+    end = end_x * size + end_y
+
+    # If start or end is a wall, return -1
+    if cells[start] == WALL or cells[end] == WALL:
         return -1
 
-    # Initialize the visited matrix and the queue for BFS traversal
-    # Both data structures are initialized with the start position
-    visited = [[False] * size for _ in range(size)]
-    visited[start_x][start_y] = True
-    queue = deque([start])
-
-    # Perform BFS traversal. Loop until the queue is empty.
-    while len(queue) > 0:
-        # At each iteration, we exhaust all elements at the current level.
-        level += 1
-
-        # Loop through only the number of elements at the current level because the queue
-        # will be modified during the iteration.
-        elements_at_level = len(queue)
-        for _ in range(0, elements_at_level):
-            # Pop the element from the queue
-            x, y = queue.popleft()
-            # If the end is reached, return the level
-            if x == end_x and y == end_y:
-                return level
-            # Visit the neighbors of the current element. They will be processed in the next level.
-            visit_neighbors(x, y, grid, size, visited, queue)
-
-    # There are no more elements to visit and the end was not reached
+    # Like the simulation, a path from a cell to itself is 1 step long
+    if start == end:
+        return 1
+
+    words = (size * size + 63) // 64
+    open_cells = size * size - np.count_nonzero(cells == WALL)
+
+    # Scratch bitset of the frontier being expanded bottom-up
+    frontier_bits = np.zeros(words, dtype=np.uint64)
+
+    # Each search has its visited cells, its current frontier and the next one
+    start_visited = np.zeros(words, dtype=np.uint64)
+    start_frontier = np.empty(size * size, dtype=np.int32)
+    start_next_frontier = np.empty(size * size, dtype=np.int32)
+    _mark(start_visited, start)
+    start_frontier[0] = start
+    start_frontier_size = 1
+
+    end_visited = np.zeros(words, dtype=np.uint64)
+    end_frontier = np.empty(size * size, dtype=np.int32)
+    end_next_frontier = np.empty(size * size, dtype=np.int32)
+    _mark(end_visited, end)
+    end_frontier[0] = end
+    end_frontier_size = 1
+
+    # Number of levels expanded and of open cells left to visit by each search
+    start_depth = 0
+    end_depth = 0
+    start_unvisited = open_cells - 1
+    end_unvisited = open_cells - 1
+
+    # A side without a frontier has visited everything reachable, so there is no path
+    while start_frontier_size > 0 and end_frontier_size > 0:
+        if start_frontier_size <= end_frontier_size:
+            start_frontier_size = _expand_level(
+                cells,
+                size,
+                start_frontier,
+                start_frontier_size,
+                frontier_bits,
+                start_next_frontier,
+                start_visited,
+                end_visited,
+                start_unvisited,
+            )
+            start_depth += 1
+            start_unvisited -= start_frontier_size
+            start_frontier, start_next_frontier = start_next_frontier, start_frontier
+        else:
+            end_frontier_size = _expand_level(
+                cells,
+                size,
+                end_frontier,
+                end_frontier_size,
+                frontier_bits,
+                end_next_frontier,
+                end_visited,
+                start_visited,
+                end_unvisited,
+            )
+            end_depth += 1
+            end_unvisited -= end_frontier_size
+            end_frontier, end_next_frontier = end_next_frontier, end_frontier
+
+        # The searches met: the path has start_depth + end_depth edges, plus the start
+        if start_frontier_size < 0 or end_frontier_size < 0:
+            return start_depth + end_depth + 1
+
+    # There are no more elements to visit and the searches did not meet
     return -1
 
 
@@ -122,7 +388,8 @@ def create_good_grid(
     size: int = 10,
     start_position: tuple[int, int] = (0, 0),
     end_position: Optional[tuple[int, int]] = None,
-) -> List[List[int]]:
+    wall_probability: float = 0.3,
+) -> np.ndarray:
     """
     Creates a grid where a valid path exists from the start to the end position.
 
@@ -130,15 +397,18 @@ def create_good_grid(
         size (int): The size of the grid (default is 10).
         start_position (tuple[int, int]): The starting position in the grid (default is (0, 0)).
         end_position (Optional[tuple[int, int]]): The end position in the grid. If None, defaults to (size-1, size-1).
+        wall_probability (float): The probability of each cell being a wall (default is 0.3, few walls make
+            solvable grids likely, so fewer grids are rejected).
 
     Returns:
-        List[List[int]]: A grid where the shortest path length is greater than 0 (i.e., a valid path exists).
+        np.ndarray: A uint8 grid where the shortest path length is greater than 0 (i.e., a valid path exists).
     """
     return create_grid(
         size=size,
         start_position=start_position,
         end_position=end_position,
         predicate=lambda x: x > 0,  # Ensures a valid path exists
+        wall_probability=wall_probability,
     )
 
 
@@ -146,7 +416,8 @@ def create_bad_grid(
     size: int = 10,
     start_position: tuple[int, int] = (0, 0),
     end_position: Optional[tuple[int, int]] = None,
-) -> List[List[int]]:
+    wall_probability: float = 0.6,
+) -> np.ndarray:
     """
     Creates a grid where no valid path exists from the start to the end position.
 
@@ -154,15 +425,18 @@ def create_bad_grid(
         size (int): The size of the grid (default is 10).
         start_position (tuple[int, int]): The starting position in the grid (default is (0, 0)).
         end_position (Optional[tuple[int, int]]): The end position in the grid. If None, defaults to (size-1, size-1).
+        wall_probability (float): The probability of each cell being a wall (default is 0.6, many walls make
+            unsolvable grids likely, so fewer grids are rejected).
 
     Returns:
-        List[List[int]]: A grid where the shortest path length is -1 (i.e., no valid path exists).
+        np.ndarray: A uint8 grid where the shortest path length is -1 (i.e., no valid path exists).
     """
     return create_grid(
         size=size,
         start_position=start_position,
         end_position=end_position,
         predicate=lambda x: x == -1,  # Ensures no valid path exists
+        wall_probability=wall_probability,
     )
 
 
@@ -171,7 +445,8 @@ def create_grid(
     start_position: tuple[int, int] = (0, 0),
     end_position: Optional[tuple[int, int]] = None,
     predicate: Callable[[int], bool] = None,
-) -> List[List[int]]:
+    wall_probability: float = 0.5,
+) -> np.ndarray:
     """
     Generates a grid based on the given size, start/end positions, and a predicate function.
 
@@ -180,31 +455,37 @@ def create_grid(
         start_position (tuple[int, int]): The starting position in the grid (default is (0, 0)).
         end_position (Optional[tuple[int, int]]): The end position in the grid. If None, defaults to (size-1, size-1).
         predicate (Callable[[int], bool]): A function that determines if the generated grid meets the desired condition.
+        wall_probability (float): The probability of each cell being a wall (default is 0.5).
 
     Returns:
-        List[List[int]]: A grid that satisfies the predicate condition.
+        np.ndarray: A uint8 grid that satisfies the predicate condition.
 
     Raises:
-        ValueError: If the grid size is less than 3.
+        ValueError: If the grid size is less than 3 or the wall probability is not within [0, 1].
     """
     # Ensure the grid size is at least 3 to allow for meaningful simulation
     if size < 3:
         raise ValueError("Size must be at least 3")
 
+    # Ensure the wall probability is a probability
+    if not 0 <= wall_probability <= 1:
+        raise ValueError("Wall probability must be between 0 and 1")
+
     # Default end position to the bottom-right corner if not provided
     if end_position is None:
         end_position = (size - 1, size - 1)
 
+    # Every candidate grid is drawn in one batch from the same generator
+    rng = np.random.default_rng()
+
     # Continuously generate grids until one satisfies the predicate condition
     while True:
         # Create a random grid with walls (1) and open cells (0)
-        grid = [
-            [random.choice([NON_WALL, WALL]) for _ in range(size)] for _ in range(size)
-        ]
+        grid = (rng.random((size, size)) < wall_probability).astype(np.uint8)
 
         # Ensure the start and end positions are open cells
-        grid[start_position[0]][start_position[1]] = NON_WALL
-        grid[end_position[0]][end_position[1]] = NON_WALL
+        grid[start_position] = NON_WALL
+        grid[end_position] = NON_WALL
 
         # Calculate the shortest path length using the BFS algorithm
         shortest_path_length = shortest_path(grid, start_position, end_position)
@@ -20,5 +20,7 @@ THIN_LINE_WIDTH = 2
 THICK_LINE_WIDTH = 4
 
 FPS = 30
+# Print the measured frame rate once per second, for debugging
+DEBUG_FPS = False
 # UPDATES_PER_SECOND = GRID_SIZE // 3
 UPDATES_PER_SECOND = 10
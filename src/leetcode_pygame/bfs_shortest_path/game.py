@@ -1,9 +1,11 @@
 import pygame
 
 from leetcode_pygame.bfs_shortest_path.constants import (
+    DEBUG_FPS,
     FPS,
     SCREEN_SIZE,
 )
+from leetcode_pygame.bfs_shortest_path.sprites import init_cell_surfaces
 
 
 class Game:
@@ -27,6 +29,16 @@ class Game:
         # Define the screen and its size
         self.screen = pygame.display.set_mode(SCREEN_SIZE)
 
+        # Pre-render the cell surfaces once; they need the display to be set up
+        init_cell_surfaces()
+
+        # The game only reacts to quitting, to released keys and to the window being
+        # uncovered (see handle_events); stop pygame from queuing any other event. Events
+        # queued before this call still reach the states, so they check the event type
+        # themselves.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYUP, pygame.WINDOWEXPOSED])
+
         # This sets the text on the title bar of the window
         pygame.display.set_caption("Shortest Path in Binary Matrix")
 
@@ -44,6 +56,9 @@ class Game:
 
         self.state = InitState(self)
 
+        # Number of frames drawn so far
+        frame_count = 0
+
         # Start the gaming loop; run the code until running=False
         while self.running:
             # We do two things here: first, ask clock to update and regulate the frame rate,
@@ -60,7 +75,11 @@ class Game:
             # The value of delta_time can be used for smooth animations, physics calculations, or any other task
             # that requires time-based adjustments that are not dependent on the actual frame rate.
             delta_time = clock.tick(FPS) / 1000  # deltaTime in seconds
-            print("FPS: ", clock.get_fps(), "Delta time: ", delta_time)
+
+            # Printing every frame would slow the loop down, so report once per second
+            frame_count += 1
+            if DEBUG_FPS and frame_count % FPS == 0:
+                print("FPS: ", clock.get_fps(), "Delta time: ", delta_time)
 
             # Game loops typically have 3 main actions: handling events, updating game state, and rendering.
             # Handle input events (e.g., keyboard, mouse) and game logic changes.
@@ -71,11 +90,16 @@ class Game:
             self.state.update(delta_time)
 
             # Render the updated state to the screen (draw the updated visuals or objects).
-            self.state.render()
+            # States that track what they changed return the dirty areas of the screen.
+            dirty_rects = self.state.render()
 
-            # Flip the display buffers to update the screen with the new frame.
-            # This is typically used in double-buffered rendering to prevent flickering.
-            pygame.display.flip()
+            if dirty_rects is None:
+                # Flip the display buffers to update the screen with the new frame.
+                # This is typically used in double-buffered rendering to prevent flickering.
+                pygame.display.flip()
+            elif dirty_rects:
+                # Copy only the changed areas of the frame to the display.
+                pygame.display.update(dirty_rects)
 
             # Check if there is a state change request pending.
             if self.next_state is not None:
@@ -90,23 +114,22 @@ class Game:
         pygame.quit()
 
     def handle_events(self):
-        # Initialize an empty list to store the events to be processed.
-        events = []
-
-        # Loop through all events in the event queue.
-        for event in pygame.event.get():
-            # If the event is a quit event (e.g., closing the window).
-            if event.type == pygame.QUIT:
-                # Set the running flag to False to stop the game loop.
-                self.running = False
-                # Exit the method immediately to stop handling further events.
-                return
-            else:
-                # Add all other events to the events list for further processing.
-                events.append(event)
-
-        # Pass the collected events to the current game state's handle_events method for processing.
-        self.state.handle_events(events)
+        # Take only the quit events (e.g., closing the window) off the queue; pygame
+        # filters them by type in C without handing every event to Python.
+        if pygame.event.get(pygame.QUIT):
+            # Set the running flag to False to stop the game loop.
+            self.running = False
+            # Exit the method immediately to stop handling further events.
+            return
+
+        # States may only update the changed parts of the display, so parts of the window
+        # that were covered would stay blank on systems that don't keep window contents.
+        # The screen surface still holds the whole frame; copy all of it to the window.
+        if pygame.event.get(pygame.WINDOWEXPOSED):
+            pygame.display.flip()
+
+        # Pass all remaining events to the current game state's handle_events method for processing.
+        self.state.handle_events(pygame.event.get())
 
 
 if __name__ == "__main__":
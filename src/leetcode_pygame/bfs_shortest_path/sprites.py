@@ -1,6 +1,7 @@
-from functools import cache
-from typing import Final, Literal
+from functools import lru_cache
+from typing import Final, Literal, Optional
 
+import numpy as np
 import pygame
 
 from leetcode_pygame.bfs_shortest_path.constants import (
@@ -12,11 +13,28 @@ from leetcode_pygame.bfs_shortest_path.constants import (
     GREEN,
     RED,
     THIN_LINE_WIDTH,
+    WHITE,
 )
 
 # Defines possible types of grid cells, each corresponding to a visual state.
 CellType = Literal["wall", "unvisited", "visited", "final_path"]
 
+# All cell types in a fixed order; GridCells stores the index of a type as a single byte.
+CELL_TYPES: tuple[CellType, ...] = ("wall", "unvisited", "visited", "final_path")
+CELL_TYPE_IDS: dict[CellType, int] = {
+    cell_type: type_id for type_id, cell_type in enumerate(CELL_TYPES)
+}
+
+# Ids of the types GridCells tests for, looked up once rather than in every loop.
+_WALL_TYPE_ID: Final[int] = CELL_TYPE_IDS["wall"]
+_UNVISITED_TYPE_ID: Final[int] = CELL_TYPE_IDS["unvisited"]
+
+# Pre-rendered surfaces for each cell type, populated by `init_cell_surfaces`.
+_CELL_SURFACES: Optional[dict[CellType, pygame.Surface]] = None
+
+# Screen rectangles of grid cells keyed by (x, y), shared by every grid of the game.
+_CELL_RECTS: dict[tuple[int, int], pygame.Rect] = {}
+
 
 def create_wall(cell_size: int = CELL_SIZE, padding: int = 2) -> pygame.Surface:
     """Creates a surface representing a wall cell.
@@ -83,127 +101,249 @@ def create_circle(
     return surface
 
 
-@cache
-def get_cell_surfaces() -> dict[CellType, pygame.Surface]:
-    """Pre-renders and caches surfaces for different cell types.
+def init_cell_surfaces() -> None:
+    """Pre-renders the surfaces for the different cell types.
 
-    Returns:
-        dict[CellType, pygame.Surface]: A dictionary mapping cell types to
-        their corresponding pre-rendered surfaces.
+    Must be called once after the display is set up, since the surfaces are converted
+    to the display's pixel format. Read the surfaces with `get_cell_surfaces` afterwards.
     """
-    surfaces = {
+    global _CELL_SURFACES
+    _CELL_SURFACES = {
         "wall": create_wall(),  # Surface for wall cells
         "unvisited": create_circle(GRAY),  # Surface for unvisited cells
         "visited": create_circle(BLUE),  # Surface for visited cells
         "final_path": create_circle(GREEN),  # Surface for the shortest path
     }
-    return surfaces
 
 
-class CellSprite(pygame.sprite.Sprite):
-    """Represents a grid cell in the simulation as a Pygame sprite.
+def get_cell_surfaces() -> dict[CellType, pygame.Surface]:
+    """Returns the pre-rendered surfaces for different cell types.
+
+    Returns:
+        dict[CellType, pygame.Surface]: A dictionary mapping cell types to
+        their corresponding pre-rendered surfaces.
+
+    Raises:
+        RuntimeError: If `init_cell_surfaces` has not been called yet.
+    """
+    if _CELL_SURFACES is None:
+        raise RuntimeError("Cell surfaces are not initialized, call init_cell_surfaces")
+    return _CELL_SURFACES
+
+
+def get_cell_rect(x: int, y: int) -> pygame.Rect:
+    """Returns the screen rectangle of the cell at (x, y), creating it on first use.
+
+    The rectangles are shared between grids, so they must not be modified.
+    """
+    rect = _CELL_RECTS.get((x, y))
+    if rect is None:
+        rect = _CELL_RECTS[(x, y)] = pygame.Rect(
+            x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE
+        )
+    return rect
+
+
+class GridCells:
+    """Stores the cells of a grid as parallel arrays rather than one sprite per cell.
+
+    The type of each cell is a byte in `cell_type_ids`, the rectangles are computed once
+    and the surfaces are shared per type, so drawing the grid only walks those arrays.
+    Walls never change, so they are drawn once into `background` and skipped afterwards.
 
     Attributes:
-        x (int): The x-coordinate of the cell in the grid.
-        y (int): The y-coordinate of the cell in the grid.
-        cell_type (CellType): The type of the cell (e.g., wall, visited, etc.).
-        image (pygame.Surface): The visual representation of the cell.
-        rect (pygame.Rect): The rectangle defining the cell's position.
+        size (int): The number of cells on each side of the grid.
+        cell_type_ids (np.ndarray): The index in CELL_TYPES of each cell's type.
+        rects (list[pygame.Rect]): The rectangle of each cell, indexed by x * size + y.
+        background (pygame.Surface): The white grid with its walls already drawn.
     """
 
-    def __init__(
-        self,
-        x: int,
-        y: int,
-        cell_type: CellType,
-    ):
-        """Initializes a CellSprite with position and type.
+    def __init__(self, walls: np.ndarray):
+        """Initializes the cells of a grid as walls or unvisited cells.
+
+        Args:
+            walls (np.ndarray): A square boolean matrix, True where the grid has a wall.
+        """
+        self.size = size = len(walls)
+        self.cell_type_ids = np.where(walls, _WALL_TYPE_ID, _UNVISITED_TYPE_ID).astype(
+            np.uint8
+        )
+        self.rects = [get_cell_rect(x, y) for x in range(size) for y in range(size)]
+        cell_surfaces = get_cell_surfaces()
+        self._surfaces = tuple(cell_surfaces[cell_type] for cell_type in CELL_TYPES)
+
+        # Cells that are not walls, the only ones drawn over the background
+        self._open_cells = np.flatnonzero(~walls.ravel())
+        self._open_rects = [self.rects[cell] for cell in self._open_cells.tolist()]
+
+        # Draw the walls once into an opaque background covering the grid
+        self.background = pygame.Surface(
+            (self.size * CELL_SIZE, self.size * CELL_SIZE)
+        ).convert()
+        self.background.fill(WHITE)
+        wall_surface = cell_surfaces["wall"]
+        self.background.blits(
+            [
+                (wall_surface, self.rects[cell])
+                for cell in np.flatnonzero(walls.ravel()).tolist()
+            ],
+            doreturn=False,
+        )
+
+    def update_type(self, x: int, y: int, cell_type: CellType) -> bool:
+        """Updates the type, and therefore the appearance, of the cell at (x, y).
 
         Args:
             x (int): The x-coordinate of the cell in the grid.
             y (int): The y-coordinate of the cell in the grid.
-            cell_type (CellType): The type of the cell (determines appearance).
+            cell_type (CellType): The new type of the cell.
+
+        Returns:
+            bool: Whether the type changed, i.e. whether the cell has to be redrawn.
         """
-        super().__init__()
-        self.x = x
-        self.y = y
-        self.cell_type = cell_type
-        self.image = get_cell_surfaces()[
-            self.cell_type
-        ]  # Assign the corresponding surface
-        self.rect = self.image.get_rect(
-            topleft=(x * CELL_SIZE, y * CELL_SIZE)
-        )  # Position in grid
-
-    def update_type(self, cell_type: CellType):
-        """Updates the cell's type and refreshes its appearance.
+        type_id = CELL_TYPE_IDS[cell_type]
+        if self.cell_type_ids[x, y] == type_id:
+            return False
+        self.cell_type_ids[x, y] = type_id
+        return True
+
+    def draw(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None) -> None:
+        """Draws the cells onto the given surface.
 
         Args:
-            cell_type (CellType): The new type of the cell.
+            surface (pygame.Surface): The surface to draw the grid into.
+            area (Optional[pygame.Rect]): If given, only the cells overlapping this
+                screen area are drawn. Defaults to None, drawing every cell.
         """
-        self.cell_type = cell_type
-        self.image = get_cell_surfaces()[
-            self.cell_type
-        ]  # Update surface based on new type
+        if area is None:
+            surface.blit(self.background, (0, 0))
+            cells = self._open_cells
+            rects = self._open_rects
+        else:
+            surface.blit(self.background, area, area)
+            # Range of cells overlapping the area, clamped to the grid
+            x_start = max(area.left // CELL_SIZE, 0)
+            x_end = min((area.right - 1) // CELL_SIZE + 1, self.size)
+            y_start = max(area.top // CELL_SIZE, 0)
+            y_end = min((area.bottom - 1) // CELL_SIZE + 1, self.size)
+            # Read the types of that range at once rather than one numpy scalar per cell
+            size = self.size
+            type_rows = self.cell_type_ids[x_start:x_end, y_start:y_end].tolist()
+            cells = [
+                x * size + y
+                for x, type_row in enumerate(type_rows, x_start)
+                for y, type_id in enumerate(type_row, y_start)
+                if type_id != _WALL_TYPE_ID
+            ]
+            rects = [self.rects[cell] for cell in cells]
+
+        # A single blits call draws the cells without a Python-level blit per cell
+        surfaces = self._surfaces
+        surface.blits(
+            [
+                (surfaces[type_id], rect)
+                for type_id, rect in zip(
+                    self.cell_type_ids.ravel()[cells].tolist(), rects
+                )
+            ],
+            doreturn=False,
+        )
 
 
-class LineSprite(pygame.sprite.Sprite):
-    """Represents a line connecting two points in the grid.
+class LineLayerSprite(pygame.sprite.Sprite):
+    """Represents the lines connecting points in the grid, all drawn into one layer.
 
     This sprite is used to visually represent paths or connections between cells
-    in the grid-based simulation. It supports drawing both straight and diagonal
-    lines with configurable width and color.
+    in the grid-based simulation. Lines are drawn once, when they are added, into a
+    transparent surface covering the whole grid, so drawing any number of lines
+    costs a single blit per frame. Both straight and diagonal lines are supported,
+    with configurable width and color.
 
     Attributes:
-        image (pygame.Surface): The surface containing the drawn line.
-        rect (pygame.Rect): The rectangular area occupied by the line.
+        image (pygame.Surface): The surface containing the drawn lines.
+        rect (pygame.Rect): The rectangular area of the grid.
     """
 
-    def __init__(
+    def __init__(self, grid_size: int):
+        """Initializes an empty LineLayerSprite covering the grid.
+
+        Args:
+            grid_size (int): The number of cells on each side of the grid.
+        """
+        super().__init__()
+
+        # Create a transparent surface covering the grid to draw the lines on.
+        size = grid_size * CELL_SIZE
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        self.rect = self.image.get_rect()
+
+        # Pixel coordinate of the center of each grid row/column, computed once
+        self._centers = [p * CELL_SIZE + CELL_SIZE // 2 for p in range(grid_size)]
+
+    def add_line(
         self,
         from_point: tuple[int, int],
         to_point: tuple[int, int],
         line_width: int = THIN_LINE_WIDTH,
         color: tuple[int, int, int] = RED,
-    ):
-        """Initializes a LineSprite connecting two grid points.
+    ) -> pygame.Rect:
+        """Draws a line connecting two grid points.
 
         Args:
             from_point (tuple[int, int]): The starting point (grid coordinates).
             to_point (tuple[int, int]): The ending point (grid coordinates).
             line_width (int, optional): The width of the line. Defaults to THIN_LINE_WIDTH.
             color (tuple[int, int, int], optional): The color of the line. Defaults to RED.
-        """
-        super().__init__()
-
-        # Convert grid coordinates to pixel coordinates.
-        x1, y1, x2, y2 = (p * CELL_SIZE for p in (*from_point, *to_point))
 
-        # Calculate the required surface dimensions to fit the line.
-        width, height = abs(x1 - x2) + CELL_SIZE, abs(y1 - y2) + CELL_SIZE
-
-        # Create a transparent surface to draw the line on.
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
-        self.rect = self.image.get_rect(topleft=(min(x1, x2), min(y1, y2)))
+        Returns:
+            pygame.Rect: The area of the layer changed by the line.
+        """
+        x1, y1 = from_point
+        x2, y2 = to_point
 
         # Adjust line width for diagonal lines to make them more visible.
         if x1 != x2 and y1 != y2:
             line_width = int(line_width * 1.5)
 
-        # Center the line within the grid cell.
-        shift_by_x = CELL_SIZE // 2 - self.rect.left
-        shift_by_y = CELL_SIZE // 2 - self.rect.top
-
-        # Draw the line from the starting point to the ending point.
-        pygame.draw.line(
+        # Draw the line between the centers of the two grid cells.
+        centers = self._centers
+        return pygame.draw.line(
             self.image,
             color,
-            (x1 + shift_by_x, y1 + shift_by_y),
-            (x2 + shift_by_x, y2 + shift_by_y),
+            (centers[x1], centers[y1]),
+            (centers[x2], centers[y2]),
             line_width,
         )
 
 
+@lru_cache(maxsize=8)
+def _get_font(font_size: int) -> pygame.font.Font:
+    """Returns the default font at the given size, loading it only once per size."""
+    return pygame.font.Font(None, font_size)
+
+
+@lru_cache(maxsize=64)
+def render_text(
+    text: str, font_size: int, color: tuple[int, int, int]
+) -> pygame.Surface:
+    """Renders text into a surface, reusing the result for repeated texts.
+
+    Font rasterization is the most expensive thing the menus do, and the same few texts
+    are shown every time the player returns to them. The returned surface is shared
+    between sprites, so it must not be drawn into.
+
+    Args:
+        text (str): The text string to render.
+        font_size (int): The font size for rendering the text.
+        color (tuple[int, int, int]): The color of the text in RGB format.
+
+    Returns:
+        pygame.Surface: A surface containing the rendered text.
+    """
+    # Render the text with the specified color, in the shared font of that size.
+    return _get_font(font_size).render(text, True, color)
+
+
 class TextSprite(pygame.sprite.Sprite):
     """
     A sprite class for rendering and displaying text in a Pygame game.
@@ -212,6 +352,8 @@ class TextSprite(pygame.sprite.Sprite):
     Pygame sprite system for rendering.
 
     Attributes:
+        font_size (int): The font size for rendering the text.
+        color (tuple[int, int, int]): The color of the text in RGB format.
         image (pygame.Surface): The surface containing the rendered text.
         rect (pygame.Rect): The rectangle that defines the boundaries of the text.
     """
@@ -227,15 +369,53 @@ class TextSprite(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Create a font object with the specified font size.
-        font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.color = color
 
         # Render the text with the specified color and store it in the 'image' attribute.
-        self.image = font.render(text, True, color)
+        # Texts that were shown before are not rendered again.
+        self.image = render_text(text, font_size, color)
 
         # Get the rectangle for the rendered text to define its position and size.
         self.rect = self.image.get_rect()
 
+    def set_text(self, text: str):
+        """
+        Replace the displayed text, keeping the sprite where it is.
+
+        Args:
+            text (str): The new text string to display in the sprite.
+        """
+        self.image = render_text(text, self.font_size, self.color)
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
+
+
+class WorldSprite(pygame.sprite.Sprite):
+    """Represents the whole grid, its cells and lines merged into a single image.
+
+    Used once the simulation is over and the grid no longer changes, so it is drawn
+    with one blit instead of a blit per cell.
+
+    Attributes:
+        image (pygame.Surface): The surface containing the cells and the lines.
+        rect (pygame.Rect): The rectangular area of the grid.
+    """
+
+    def __init__(self, cells: GridCells, lines: LineLayerSprite):
+        """Initializes the WorldSprite by drawing the cells and then the lines.
+
+        Args:
+            cells (GridCells): The cells of the grid.
+            lines (LineLayerSprite): The lines drawn over the cells.
+        """
+        super().__init__()
+
+        # The cells' background is opaque, so the image needs no transparency
+        self.image = pygame.Surface(lines.rect.size).convert()
+        cells.draw(self.image)
+        self.image.blit(lines.image, (0, 0))
+        self.rect = self.image.get_rect()
+
 
 class OverlaySprite(pygame.sprite.Sprite):
     """
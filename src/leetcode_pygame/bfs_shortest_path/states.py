@@ -1,15 +1,15 @@
 import random
 from abc import ABC, abstractmethod
-from collections import deque
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 import pygame
 
 from leetcode_pygame.bfs_shortest_path.algorithm import (
     WALL,
     create_bad_grid,
     create_good_grid,
-    visit_neighbors,
+    visit_level,
 )
 from leetcode_pygame.bfs_shortest_path.constants import (
     BLACK,
@@ -27,11 +27,13 @@ from leetcode_pygame.bfs_shortest_path.constants import (
     WHITE,
 )
 from leetcode_pygame.bfs_shortest_path.sprites import (
-    CellSprite,
     CellType,
-    LineSprite,
+    GridCells,
+    LineLayerSprite,
     OverlaySprite,
     TextSprite,
+    WorldSprite,
+    get_cell_rect,
 )
 from leetcode_pygame.bfs_shortest_path.game import Game
 
@@ -67,9 +69,13 @@ class GameState(ABC):
         """
         pass
 
-    def render(self):
+    def render(self) -> Optional[List[pygame.Rect]]:
         """
         Renders the current state of the game to the screen.
+
+        Returns:
+            Optional[List[pygame.Rect]]: The areas of the screen that changed, or None
+            if the whole screen has to be updated.
         """
         pass
 
@@ -158,6 +164,15 @@ class InitState(GameState):
         self.objects = pygame.sprite.Group()
         self.objects.add(text_1, text_2, text_3)
 
+        # Grid to create for each key: None for a random one, True for a successful
+        # path and False for a failure path
+        self.key_grid_types = {
+            pygame.K_SPACE: None,
+            pygame.K_RETURN: True,
+            pygame.K_KP_ENTER: True,
+            pygame.K_ESCAPE: False,
+        }
+
     def handle_events(self, events: List[pygame.event.Event]):
         """
         Handles input events for the InitState, where the user chooses how to proceed.
@@ -166,20 +181,15 @@ class InitState(GameState):
             events (List[pygame.event.Event]): A list of events to process.
         """
         for event in events:
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE:
-                    # Start with a randomly generated grid
-                    self._create_grid_and_navigate(GRID_SIZE, is_good=None)
-                if event.key == pygame.K_KP_ENTER or event.key == pygame.K_RETURN:
-                    # Start with a successful path grid
-                    self._create_grid_and_navigate(GRID_SIZE, is_good=True)
-                if event.key == pygame.K_ESCAPE:
-                    # Start with a failure path grid
-                    self._create_grid_and_navigate(GRID_SIZE, is_good=False)
+            if event.type == pygame.KEYUP and event.key in self.key_grid_types:
+                # Start with the grid type chosen by the key
+                self._create_grid_and_navigate(
+                    GRID_SIZE, is_good=self.key_grid_types[event.key]
+                )
 
     def _create_grid_and_navigate(
         self, size: int, is_good: bool | None = None
-    ) -> List[List[int]]:
+    ) -> np.ndarray:
         """
         Creates a grid based on the chosen type (good or bad) and transitions to
         the simulation state.
@@ -190,7 +200,7 @@ class InitState(GameState):
                                    a random choice is made.
 
         Returns:
-            List[List[int]]: The generated grid.
+            np.ndarray: The generated grid.
         """
         if is_good is None:
             is_good = random.choice([True, False])
@@ -227,7 +237,7 @@ class SimulationState(TimelyUpdateGameState):
     def __init__(
         self,
         game: Game,
-        grid: List[List[int]],
+        grid: np.ndarray,
         start_pos: tuple[int, int],
         end_pos: tuple[int, int],
     ):
@@ -236,42 +246,57 @@ class SimulationState(TimelyUpdateGameState):
 
         Args:
             game (Game): The current game instance.
-            grid (List[List[int]]): A 2D grid representing the game environment.
+            grid (np.ndarray): A 2D uint8 grid representing the game environment.
             start_pos (tuple[int, int]): The starting position for the pathfinding.
             end_pos (tuple[int, int]): The destination position for the pathfinding.
         """
         super().__init__(game, UPDATES_PER_SECOND)
 
-        self.grid = grid
+        self.grid = np.ascontiguousarray(
+            grid, dtype=np.uint8
+        )  # Copied only if the caller's grid is not already a contiguous uint8 array
         self.grid_size = len(grid)  # Only works for square grids
-        self.visited = [
-            [False] * self.grid_size for _ in range(self.grid_size)
-        ]  # Track visited cells
-        self.queue = deque([start_pos])  # Queue for BFS
-        self.parents = {
-            start_pos: None
-        }  # Store parent of each cell for path reconstruction
+        self.cells = (
+            self.grid.ravel()
+        )  # Flat view of the grid, indexed by x * grid_size + y
+        self.visited = np.zeros(
+            self.grid_size * self.grid_size, dtype=np.uint8
+        )  # Track visited cells, indexed like cells
         self.start_pos = start_pos
         self.end_pos = end_pos
-        self.visited[start_pos[0]][
-            start_pos[1]
-        ] = True  # Mark start position as visited
-        self.cell_sprites = pygame.sprite.Group()  # Group for cell sprites
-        self.line_sprites = (
-            pygame.sprite.Group()
-        )  # Group for lines representing the BFS path
-        self.text_sprites = (
-            pygame.sprite.GroupSingle()
+        self.start_cell = (
+            start_pos[0] * self.grid_size + start_pos[1]
+        )  # Start and end positions, encoded as x * grid_size + y
+        self.end_cell = end_pos[0] * self.grid_size + end_pos[1]
+        self.queue = np.empty(
+            self.grid_size * self.grid_size, dtype=np.int32
+        )  # Queue for BFS, holding cells encoded like start_cell
+        self.queue[0] = self.start_cell
+        self.queue_head = 0  # The current BFS level is queue[queue_head:queue_tail]
+        self.queue_tail = 1
+        self.parents = np.full(
+            self.grid_size * self.grid_size, -1, dtype=np.int32
+        )  # Store parent of each cell for path reconstruction, -1 if none
+        self.visited[self.start_cell] = 1  # Mark start position as visited
+        self.grid_cells = GridCells(
+            self.grid == WALL
+        )  # Type of every cell, initially walls and unvisited cells
+        self.lines = LineLayerSprite(
+            self.grid_size
+        )  # Layer for lines representing the BFS path
+        self.level_sprite = TextSprite(
+            "Current Level: 0", 36, BLACK
+        )  # Text showing the level, updated in place
+        self.level_sprite.rect.topleft = (THIN_LINE_WIDTH, self.grid_size * CELL_SIZE)
+        self.dirty_rects = []  # Areas of the screen changed since the last render
+        self.needs_full_redraw = (
+            True  # The first render replaces the previous state's frame
+        )
+        self.text_sprites = pygame.sprite.GroupSingle(
+            self.level_sprite
         )  # Single group for text (level display)
         self.level = 0  # BFS level counter
 
-        # Initialize cell sprites for the grid based on the type of each cell
-        for x in range(len(self.grid)):
-            for y in range(len(self.grid[x])):
-                cell_type = "wall" if self.grid[x][y] == WALL else "unvisited"
-                cell_sprite = CellSprite(x, y, cell_type)
-                self.cell_sprites.add(cell_sprite)
-
         self.update_cell_type(start_pos[0], start_pos[1], "visited")
 
     def perform_update(self):
@@ -279,45 +304,52 @@ class SimulationState(TimelyUpdateGameState):
         Perform one update step for the BFS pathfinding algorithm.
         If the queue is empty, it transitions to the next state.
         """
-        if len(self.queue) == 0:
+        if self.queue_head == self.queue_tail:
             # If the queue is empty, no path is found; transition to NoPathState
             entities = self.get_all_sprites_as_group()
             self.game.next_state = NoPathState(self.game, entities, self.level)
             return
 
-        elements_at_level = len(self.queue)
         self.level += 1  # Increase the level (depth) of BFS
 
-        # Process each element at the current BFS level
-        for _ in range(0, elements_at_level):
-            x, y = self.queue.popleft()
-            if (x, y) == self.end_pos:
-                # If the end position is reached, build the final path
-                self.build_final_path()
-                entities = self.get_all_sprites_as_group()
-                # Navigate to CompletionState to display the result
-                self.game.next_state = CompletionState(self.game, entities, self.level)
-                return
+        # Process each element at the current BFS level; this alters visited, queue and parents
+        found, new_tail = visit_level(
+            self.cells,
+            self.grid_size,
+            self.visited,
+            self.queue,
+            self.queue_head,
+            self.queue_tail,
+            self.parents,
+            self.end_cell,
+        )
 
-            # Visit neighboring cells of the current position
-            self.visit_neighbors(x, y)
+        # Show the cells discovered at this level
+        self.show_neighbors(self.queue[self.queue_tail : new_tail])
 
-    def visit_neighbors(self, x: int, y: int) -> None:
+        if found:
+            # If the end position is reached, build the final path
+            self.build_final_path()
+            entities = self.get_all_sprites_as_group()
+            # Navigate to CompletionState to display the result
+            self.game.next_state = CompletionState(self.game, entities, self.level)
+            return
+
+        # The cells discovered at this level are processed in the next update
+        self.queue_head, self.queue_tail = self.queue_tail, new_tail
+
+    def show_neighbors(self, neighbors: np.ndarray) -> None:
         """
-        Visit all valid neighboring cells and update their state.
+        Mark newly visited cells and draw lines from their parents to them.
 
         Args:
-            x (int): The x-coordinate of the current cell.
-            y (int): The y-coordinate of the current cell.
+            neighbors (np.ndarray): The visited cells, encoded as x * grid_size + y.
         """
-        # This function alters visited and queue
-        neighbors = visit_neighbors(
-            x, y, self.grid, self.grid_size, self.visited, self.queue
-        )
-        for neighbor in neighbors:
-            self.parents[neighbor] = (x, y)  # Set parent for path reconstruction
-            self.update_cell_type(neighbor[0], neighbor[1], "visited")
-            self.add_line((x, y), neighbor)
+        parents = self.parents[neighbors]
+        for neighbor, parent in zip(neighbors.tolist(), parents.tolist()):
+            x, y = divmod(neighbor, self.grid_size)
+            self.update_cell_type(x, y, "visited")
+            self.add_line(divmod(parent, self.grid_size), (x, y))
 
     def handle_events(self, events: List[pygame.event.Event]):
         """
@@ -351,35 +383,34 @@ class SimulationState(TimelyUpdateGameState):
             value (int): The new level value.
         """
         self._level = value
-        sprite = TextSprite(f"Current Level: {value}", 36, BLACK)
-        sprite.rect.topleft = (THIN_LINE_WIDTH, self.grid_size * CELL_SIZE)
-        self.text_sprites.add(sprite)
+        old_rect = self.level_sprite.rect.copy()
+        self.level_sprite.set_text(f"Current Level: {value}")
+        self.dirty_rects.append(old_rect.union(self.level_sprite.rect))
 
     def update_cell_type(self, x: int, y: int, cell_type: CellType) -> None:
         """
-        Update the cell sprite type for the given position.
+        Update the cell type for the given position.
 
         Args:
             x (int): The x-coordinate of the cell.
             y (int): The y-coordinate of the cell.
             cell_type (CellType): The new cell type.
         """
-        for sprite in self.cell_sprites:
-            if sprite.x == x and sprite.y == y:
-                sprite.update_type(cell_type)
-                break
+        if self.grid_cells.update_type(x, y, cell_type):
+            # Only redraw the cell if its appearance changed
+            self.dirty_rects.append(get_cell_rect(x, y))
 
-    def get_all_sprites_as_group(self) -> pygame.sprite.Group:
+    def get_all_sprites_as_group(self) -> pygame.sprite.OrderedUpdates:
         """
-        Get all sprites (cells, lines, text) as a pygame sprite group.
+        Get the grid as a pygame sprite group, its cells and lines merged into one sprite.
+
+        The group is ordered, so the next state can add its own sprites to it, on top of
+        the grid, instead of copying it into a group of its own.
 
         Returns:
-            pygame.sprite.Group: The group containing all sprites for rendering.
+            pygame.sprite.OrderedUpdates: The group containing all sprites for rendering.
         """
-        entities = pygame.sprite.Group()
-        entities.add(self.cell_sprites)
-        entities.add(self.line_sprites)
-        return entities
+        return pygame.sprite.OrderedUpdates(WorldSprite(self.grid_cells, self.lines))
 
     def add_line(
         self,
@@ -388,15 +419,16 @@ class SimulationState(TimelyUpdateGameState):
         line_width: int = THIN_LINE_WIDTH,
     ) -> None:
         """
-        Add a line sprite between two points to represent the BFS path.
+        Add a line between two points to represent the BFS path.
 
         Args:
             from_point (tuple[int, int]): The starting point of the line.
             to_point (tuple[int, int]): The ending point of the line.
             line_width (int, optional): The width of the line. Defaults to THIN_LINE_WIDTH.
         """
-        line_sprite = LineSprite(from_point, to_point, line_width, RED)
-        self.line_sprites.add(line_sprite)
+        self.dirty_rects.append(
+            self.lines.add_line(from_point, to_point, line_width, RED)
+        )
 
     def build_final_path(self) -> None:
         """
@@ -405,22 +437,53 @@ class SimulationState(TimelyUpdateGameState):
         current = self.end_pos
         self.update_cell_type(current[0], current[1], "final_path")
 
-        # Reconstruct the path by tracing the parents
-        while current != self.start_pos:
+        # Reconstruct the path by tracing the parents; only the start has none (-1)
+        parent = int(self.parents[self.end_cell])
+        while parent != -1:
             previous = current
-            current = self.parents[current]
+            current = divmod(parent, self.grid_size)
             self.update_cell_type(current[0], current[1], "final_path")
             self.add_line(current, previous, line_width=THICK_LINE_WIDTH)
+            parent = int(self.parents[parent])
 
-    def render(self):
+    def render(self) -> Optional[List[pygame.Rect]]:
         """
         Render all sprites (cells, lines, and text) to the screen.
+
+        Only the areas changed since the previous render are redrawn, except on the first
+        render, which draws the whole screen.
+
+        Returns:
+            Optional[List[pygame.Rect]]: The areas of the screen that changed, or None
+            if the whole screen has to be updated.
         """
         screen = self.game.screen
-        screen.fill(WHITE)
 
-        self.cell_sprites.draw(screen)
-        self.line_sprites.draw(screen)
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            self.dirty_rects = []
+            self.draw_area(screen, None)
+            return None
+
+        dirty_rects, self.dirty_rects = self.dirty_rects, []
+        for rect in dirty_rects:
+            # Clip to the area, so cells overlapping its edges don't blend over themselves
+            screen.set_clip(rect)
+            self.draw_area(screen, rect)
+        screen.set_clip(None)
+        return dirty_rects
+
+    def draw_area(self, screen: pygame.Surface, area: Optional[pygame.Rect]) -> None:
+        """
+        Draw the background, cells, lines and text covering an area of the screen.
+
+        Args:
+            screen (pygame.Surface): The surface to draw into, clipped to the area.
+            area (Optional[pygame.Rect]): The area to draw, or None for the whole screen.
+        """
+        screen.fill(WHITE)
+        self.grid_cells.draw(screen, area)
+        screen.blit(self.lines.image, self.lines.rect)
         self.text_sprites.draw(screen)
 
 
@@ -447,8 +510,7 @@ class CompletionState(GameState):
             shortest_path (int): The length of the shortest path found in the simulation.
         """
         self.game = game
-        self.entities = pygame.sprite.Group()
-        self.entities.add(entities)
+        self.entities = entities  # Take over the group; the text is added on top
         self.shortest_path = shortest_path
 
         text_1 = TextSprite(
@@ -469,10 +531,9 @@ class CompletionState(GameState):
             events (List[pygame.event.Event]): A list of events that are checked for input.
         """
         for event in events:
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_SPACE:
-                    self.game.next_state = InitState(self.game)
-                    return
+            if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
+                self.game.next_state = InitState(self.game)
+                return
 
     def render(self):
         """
@@ -509,12 +570,7 @@ class NoPathState(GameState):
             final_level (int): The number of levels that were visited without finding a path.
         """
         self.game = game  # Store the game instance to facilitate state transitions
-        self.entities = (
-            pygame.sprite.OrderedUpdates()
-        )  # Create an ordered sprite group for entities
-        self.entities.add(
-            entities
-        )  # Add the provided entities (sprites, text) to the group
+        self.entities = entities  # Take over the group; text and overlay go on top
 
         # Create a text sprite to display the message about the path not being found
         text_1 = TextSprite(
@@ -546,11 +602,12 @@ class NoPathState(GameState):
             events (List[pygame.event.Event]): A list of events that are checked for input.
         """
         for event in events:  # Loop through all the events to check for key presses
-            if event.type == pygame.KEYUP:  # Check if a key has been released
-                if event.key == pygame.K_SPACE:  # Check if the space key was pressed
-                    self.game.next_state = InitState(
-                        self.game
-                    )  # Transition to the initial state
+            if (
+                event.type == pygame.KEYUP and event.key == pygame.K_SPACE
+            ):  # Check if the space key was released
+                self.game.next_state = InitState(
+                    self.game
+                )  # Transition to the initial state
 
     def render(self):
         """
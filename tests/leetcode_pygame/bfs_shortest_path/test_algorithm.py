@@ -1,4 +1,43 @@
-from leetcode_pygame.bfs_shortest_path.algorithm import shortest_path
+import numpy as np
+import pytest
+
+from leetcode_pygame.bfs_shortest_path.algorithm import (
+    WALL,
+    create_bad_grid,
+    create_good_grid,
+    create_grid,
+    shortest_path,
+    visit_level,
+)
+
+
+def level_by_level_shortest_path(grid, start, end):
+    # Plain BFS, one level at a time, the same steps the simulation animates
+    size = len(grid)
+    if grid[start[0]][start[1]] == WALL or grid[end[0]][end[1]] == WALL:
+        return -1
+    visited = {start}
+    frontier = [start]
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = []
+        for x, y in frontier:
+            if (x, y) == end:
+                return level
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    neighbor = (x + dx, y + dy)
+                    if (
+                        0 <= neighbor[0] < size
+                        and 0 <= neighbor[1] < size
+                        and grid[neighbor[0]][neighbor[1]] != WALL
+                        and neighbor not in visited
+                    ):
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+        frontier = next_frontier
+    return -1
 
 
 def test_shortest_path_2x2_solvable():
@@ -42,3 +81,113 @@ def test_shortest_path_5x5_unsolvable():
         [1, 0, 0, 0, 0],
     ]
     assert -1 == shortest_path(grid)
+
+
+def test_shortest_path_start_is_end():
+    grid = [
+        [0, 1],
+        [1, 0],
+    ]
+    assert 1 == shortest_path(grid, start=(1, 1), end=(1, 1))
+    assert -1 == shortest_path(grid, start=(0, 1), end=(0, 1))
+
+
+@pytest.mark.parametrize(
+    "start, end", [((0, 0), (0, 5)), ((0, 0), (3, 3)), ((-1, 0), (2, 2))]
+)
+def test_shortest_path_rejects_cells_outside_grid(start, end):
+    grid = [[0] * 3 for _ in range(3)]
+    with pytest.raises(IndexError):
+        shortest_path(grid, start, end)
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [np.zeros((3, 2), dtype=np.uint8), [[0, 0, 0, 1, 0], [0, 0, 0, 0, 0]]],
+)
+def test_shortest_path_rejects_non_square_grid(grid):
+    with pytest.raises(ValueError):
+        shortest_path(grid)
+
+
+def test_shortest_path_accepts_numpy_grid():
+    grid = np.array(
+        [
+            [0, 0, 0],
+            [1, 1, 0],
+            [1, 1, 0],
+        ],
+        dtype=np.uint8,
+    )
+    assert 4 == shortest_path(grid)
+
+
+def test_create_good_grid_is_solvable():
+    grid = create_good_grid(size=10)
+    assert grid.shape == (10, 10)
+    assert grid.dtype == np.uint8
+    assert shortest_path(grid) > 0
+
+
+def test_create_bad_grid_is_unsolvable():
+    grid = create_bad_grid(size=10)
+    assert grid.shape == (10, 10)
+    assert grid.dtype == np.uint8
+    assert -1 == shortest_path(grid)
+
+
+def test_create_grid_wall_probability():
+    grid = create_grid(size=10, predicate=lambda x: True, wall_probability=1)
+    # Everything but the start and the end is a wall
+    assert grid.sum() == 10 * 10 - 2
+
+
+def test_create_grid_rejects_invalid_wall_probability():
+    with pytest.raises(ValueError):
+        create_grid(size=10, predicate=lambda x: True, wall_probability=1.5)
+
+
+def test_shortest_path_matches_level_by_level_bfs():
+    rng = np.random.default_rng(42)
+    for _ in range(500):
+        size = int(rng.integers(1, 16))
+        grid = (rng.random((size, size)) < rng.random()).astype(np.uint8)
+        start = tuple(int(i) for i in rng.integers(0, size, 2))
+        end = tuple(int(i) for i in rng.integers(0, size, 2))
+        expected = level_by_level_shortest_path(grid, start, end)
+        assert expected == shortest_path(grid, start, end)
+
+
+def test_visit_level_records_parents():
+    # The second example on the LeetCode question, visited one level at a time
+    grid = np.array(
+        [
+            [0, 0, 0],
+            [1, 1, 0],
+            [1, 1, 0],
+        ],
+        dtype=np.uint8,
+    )
+    visited = np.zeros(9, dtype=np.uint8)
+    queue = np.empty(9, dtype=np.int32)
+    parents = np.full(9, -1, dtype=np.int32)
+    visited[0] = 1
+    queue[0] = 0
+    head, tail = 0, 1
+    level = 0
+    while head < tail:
+        level += 1
+        found, new_tail = visit_level(
+            grid.ravel(), 3, visited, queue, head, tail, parents, 8
+        )
+        if found:
+            break
+        head, tail = tail, new_tail
+
+    assert found
+    assert 4 == level
+    # Walk back from the end to the start
+    path = [8]
+    while path[-1] != 0:
+        path.append(int(parents[path[-1]]))
+    assert [8, 5, 1, 0] == path